@@ -1,6 +1,9 @@
+import hashlib
 import nox
 import os
 import sys
+import tarfile
+import tempfile
 from pathlib import Path
 
 
@@ -18,8 +21,13 @@ PYBAMM_ENV = {
     "SUNDIALS_INST": f"{homedir}/.local",
     "LD_LIBRARY_PATH": f"{homedir}/.local/lib",
     "PYTHONIOENCODING": "utf-8",
+    # Prefer the wheels in pip's cache over building heavy binary dependencies
+    # (numpy, scipy, casadi, ...) from source
+    "PIP_PREFER_BINARY": "1",
 }
 VENV_DIR = Path("./venv").resolve()
+# Snapshots of the SUNDIALS and SuiteSparse installation built by pybamm-requires
+PYBAMM_REQUIRES_CACHE = os.path.expanduser("~/.cache/pybamm")
 
 
 def set_environment_variables(env_dict, session):
@@ -38,13 +46,156 @@ def set_environment_variables(env_dict, session):
         session.env[key] = value
 
 
+def get_sundials_snapshot_path():
+    """
+    Returns the path of the snapshot of the SUNDIALS and SuiteSparse installation,
+    keyed on the contents of the script used to build it.
+    """
+    with open("scripts/install_KLU_Sundials.py", "rb") as f:
+        key = hashlib.sha256(f.read()).hexdigest()[:16]
+    return os.path.join(PYBAMM_REQUIRES_CACHE, f"sundials-{key}.tar.gz")
+
+
+# Libraries and headers installed into ~/.local by scripts/install_KLU_Sundials.py,
+# relative to ~/.local. Only these are stored in the snapshot
+SUNDIALS_SNAPSHOT_PATTERNS = [
+    "lib/libsundials_*",
+    "lib/libsuitesparseconfig*",
+    "lib/libklu*",
+    "lib/libamd*",
+    "lib/libcolamd*",
+    "lib/libbtf*",
+    "include/sundials",
+    "include/idas",
+    "include/nvector",
+    "include/sunlinsol",
+    "include/sunmatrix",
+    "include/sunnonlinsol",
+    "include/sunmemory",
+    "include/suitesparse",
+    "include/SuiteSparse_config.h",
+    "include/klu.h",
+    "include/amd.h",
+    "include/colamd.h",
+    "include/btf.h",
+]
+# The libraries checked by check_libraries_installed in scripts/install_KLU_Sundials.py
+SUNDIALS_LIBRARIES = [
+    "libsundials_idas",
+    "libsundials_sunlinsolklu",
+    "libsundials_sunlinsoldense",
+    "libsundials_sunlinsolspbcgs",
+    "libsundials_sunlinsollapackdense",
+    "libsundials_sunmatrixsparse",
+    "libsundials_nvecserial",
+    "libsundials_nvecopenmp",
+    "libsuitesparseconfig",
+    "libklu",
+    "libamd",
+    "libcolamd",
+    "libbtf",
+]
+
+
+def sundials_libraries_installed():
+    """
+    Returns True if the SUNDIALS and SuiteSparse libraries are installed in ~/.local.
+    """
+    extension = ".dylib" if sys.platform == "darwin" else ".so"
+    lib_dir = os.path.join(homedir, ".local", "lib")
+    return all(
+        os.path.isfile(os.path.join(lib_dir, library + extension))
+        for library in SUNDIALS_LIBRARIES
+    )
+
+
+def save_sundials_snapshot(snapshot_path):
+    """
+    Archives the SUNDIALS and SuiteSparse libraries and headers installed in ~/.local.
+
+    Parameters
+    -----------
+        snapshot_path : str
+            The path of the archive to create.
+
+    """
+    local_dir = Path(homedir, ".local")
+    os.makedirs(PYBAMM_REQUIRES_CACHE, exist_ok=True)
+    # Write to a temporary file and move it into place once complete, so that an
+    # interrupted run does not leave a truncated snapshot behind
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(snapshot_path), suffix=".tar.gz.tmp"
+    )
+    os.close(fd)
+    try:
+        with tarfile.open(tmp_path, "w:gz") as tar:
+            for pattern in SUNDIALS_SNAPSHOT_PATTERNS:
+                for path in sorted(local_dir.glob(pattern)):
+                    tar.add(
+                        path,
+                        arcname=os.path.join(".local", path.relative_to(local_dir)),
+                    )
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def restore_sundials_snapshot(snapshot_path):
+    """
+    Extracts a snapshot created by :func:`save_sundials_snapshot` into ~/.local.
+    A snapshot that cannot be read is deleted.
+
+    Parameters
+    -----------
+        snapshot_path : str
+            The path of the archive to extract.
+
+    Returns
+    -------
+        bool
+            True if the snapshot was restored, False if it was corrupt.
+
+    """
+    try:
+        with tarfile.open(snapshot_path, "r:gz") as tar:
+            # The "data" filter rejects absolute paths and links outside the home
+            # directory. It is available in Python 3.12 and recent patch releases
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(homedir, filter="data")
+            else:
+                tar.extractall(homedir)
+    except (tarfile.ReadError, EOFError):
+        os.remove(snapshot_path)
+        return False
+    return True
+
+
 @nox.session(name="pybamm-requires")
 def run_pybamm_requires(session):
     """Download, compile, and install the build-time requirements for Linux and macOS. Supports --install-dir for custom installation paths and --force to force installation."""
     set_environment_variables(PYBAMM_ENV, session=session)
     if sys.platform != "win32":
-        session.install("cmake", silent=False)
-        session.run("python", "scripts/install_KLU_Sundials.py", *session.posargs)
+        # Only the default installation directory is snapshotted, custom
+        # installation paths and --force always go through a full build
+        snapshot_path = None if session.posargs else get_sundials_snapshot_path()
+        installed = sundials_libraries_installed()
+        restored = False
+        if (
+            snapshot_path is not None
+            and os.path.exists(snapshot_path)
+            and not installed
+        ):
+            session.log(f"Restoring SUNDIALS and SuiteSparse from {snapshot_path}")
+            restored = restore_sundials_snapshot(snapshot_path)
+            if not restored:
+                session.warn(f"Deleted corrupt snapshot {snapshot_path}, rebuilding")
+        if not restored:
+            session.install("cmake", silent=False)
+            session.run("python", "scripts/install_KLU_Sundials.py", *session.posargs)
+            # Only snapshot libraries that were built by this version of the script
+            if snapshot_path is not None and not installed:
+                save_sundials_snapshot(snapshot_path)
         if not os.path.exists("./pybind11"):
             session.run(
                 "git",
@@ -61,8 +212,7 @@ def run_pybamm_requires(session):
 def run_coverage(session):
     """Run the coverage tests and generate an XML report."""
     set_environment_variables(PYBAMM_ENV, session=session)
-    session.install("coverage", silent=False)
-    session.install("-e", ".[all,dev,jax]", silent=False)
+    session.install("coverage", "wheel", "-e", ".[all,dev,jax]", silent=False)
     session.run("pytest", "--cov=pybamm", "--cov-report=xml", "tests/unit")
 
 
@@ -70,14 +220,15 @@ def run_coverage(session):
 def run_integration(session):
     """Run the integration tests."""
     set_environment_variables(PYBAMM_ENV, session=session)
-    session.install("-e", ".[all,dev,jax]", silent=False)
+    session.install("wheel", "-e", ".[all,dev,jax]", silent=False)
     session.run("python", "run-tests.py", "--integration")
 
 
 @nox.session(name="doctests")
 def run_doctests(session):
     """Run the doctests and generate the output(s) in the docs/build/ directory."""
-    session.install("-e", ".[all,dev,docs]", silent=False)
+    set_environment_variables(PYBAMM_ENV, session=session)
+    session.install("wheel", "-e", ".[all,dev,docs]", silent=False)
     session.run("python", "run-tests.py", "--doctest")
 
 
@@ -85,7 +236,7 @@ def run_doctests(session):
 def run_unit(session):
     """Run the unit tests."""
     set_environment_variables(PYBAMM_ENV, session=session)
-    session.install("-e", ".[all,dev,jax]", silent=False)
+    session.install("wheel", "-e", ".[all,dev,jax]", silent=False)
     session.run("python", "run-tests.py", "--unit")
 
 
@@ -93,7 +244,7 @@ def run_unit(session):
 def run_examples(session):
     """Run the examples tests for Jupyter notebooks."""
     set_environment_variables(PYBAMM_ENV, session=session)
-    session.install("-e", ".[all,dev]", silent=False)
+    session.install("wheel", "-e", ".[all,dev]", silent=False)
     notebooks_to_test = session.posargs if session.posargs else []
     session.run("pytest", "--nbmake", *notebooks_to_test, external=True)
 
@@ -105,8 +256,7 @@ def run_scripts(session):
     # Temporary fix for Python 3.12 CI. TODO: remove after
     # https://bitbucket.org/pybtex-devs/pybtex/issues/169/replace-pkg_resources-with
     # is fixed
-    session.install("setuptools", silent=False)
-    session.install("-e", ".[all,dev]", silent=False)
+    session.install("setuptools", "wheel", "-e", ".[all,dev]", silent=False)
     session.run("python", "run-tests.py", "--scripts")
 
 
@@ -120,12 +270,13 @@ def set_dev(session):
     # Temporary fix for Python 3.12 CI. TODO: remove after
     # https://bitbucket.org/pybtex-devs/pybtex/issues/169/replace-pkg_resources-with
     # is fixed
-    session.run(python, "-m", "pip", "install", "setuptools", external=True)
     session.run(
         python,
         "-m",
         "pip",
         "install",
+        "setuptools",
+        "wheel",
         "-e",
         ".[all,dev,jax]",
         external=True,
@@ -133,18 +284,20 @@ def set_dev(session):
 
 
 @nox.session(name="tests")
-def run_tests(session):
-    """Run the unit tests and integration tests sequentially."""
+@nox.parametrize("suite", ["unit", "integration"])
+def run_tests(session, suite):
+    """Run the unit tests and integration tests, each suite in its own session."""
     set_environment_variables(PYBAMM_ENV, session=session)
-    session.install("-e", ".[all,dev,jax]", silent=False)
-    session.run("python", "run-tests.py", "--all")
+    session.install("wheel", "-e", ".[all,dev,jax]", silent=False)
+    session.run("python", "run-tests.py", f"--{suite}")
 
 
 @nox.session(name="docs")
 def build_docs(session):
     """Build the documentation and load it in a browser tab, rebuilding on changes."""
+    set_environment_variables(PYBAMM_ENV, session=session)
     envbindir = session.bin
-    session.install("-e", ".[all,docs]", silent=False)
+    session.install("wheel", "-e", ".[all,docs]", silent=False)
     session.chdir("docs")
     # Local development
     if session.interactive:
@@ -175,12 +328,16 @@ def build_docs(session):
 @nox.session(name="pre-commit")
 def lint(session):
     """Check all files against the defined pre-commit hooks."""
+    set_environment_variables(PYBAMM_ENV, session=session)
     session.install("pre-commit", silent=False)
     session.run("pre-commit", "run", "--all-files")
 
 
 @nox.session(name="quick", reuse_venv=True)
-def run_quick(session):
-    """Run integration tests, unit tests, and doctests sequentially"""
-    run_tests(session)
-    run_doctests(session)
+@nox.parametrize("suite", ["unit", "integration", "doctests"])
+def run_quick(session, suite):
+    """Run integration tests, unit tests, and doctests, each suite in its own session"""
+    if suite == "doctests":
+        run_doctests(session)
+    else:
+        run_tests(session, suite)
@@ -90,15 +90,16 @@ class LeadingOrder(BaseElectrolyteDiffusion):
             + param.p.L * (sum_s_j_p_0 - param.t_plus(c_e_av, T_av) * sum_a_j_p_0)
         ) / param.F
 
-        self.rhs = {
-            c_e_av: 1
-            / (param.n.L * eps_n_av + param.s.L * eps_s_av + param.p.L * eps_p_av)
-            * (
-                source_terms
-                - c_e_av * (param.n.L * deps_n_dt_av + param.p.L * deps_p_dt_av)
-                - c_e_av * param.s.L * div_Vbox_s_av
-            )
-        }
+        # Electrolyte volume per unit area, and its rate of change due to porosity
+        # changes and transverse convection in the separator
+        eps_L_av = param.n.L * eps_n_av + param.s.L * eps_s_av + param.p.L * eps_p_av
+        deps_L_dt_av = (
+            param.n.L * deps_n_dt_av
+            + param.p.L * deps_p_dt_av
+            + param.s.L * div_Vbox_s_av
+        )
+
+        self.rhs = {c_e_av: (source_terms - c_e_av * deps_L_dt_av) / eps_L_av}
 
     def set_initial_conditions(self, variables):
         c_e = variables["X-averaged electrolyte concentration [mol.m-3]"]
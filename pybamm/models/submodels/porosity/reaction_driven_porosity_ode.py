@@ -26,7 +26,15 @@ class ReactionDrivenODE(BaseModel):
         eps_dict = {}
         for domain in self.options.whole_cell_domains:
             Domain = domain.capitalize()
-            if self.x_average is True:
+            if self.x_average is True and domain == "separator":
+                # There are no reactions in the separator so its porosity does not
+                # change, and is not a state of the model
+                domain_param = self.param.domain_params["separator"]
+                eps_k_av = pybamm.PrimaryBroadcast(
+                    pybamm.x_average(domain_param.epsilon_init), "current collector"
+                )
+                eps_k = pybamm.PrimaryBroadcast(eps_k_av, domain)
+            elif self.x_average is True:
                 eps_k_av = pybamm.Variable(
                     f"X-averaged {domain} porosity",
                     domain="current collector",
@@ -76,6 +84,8 @@ class ReactionDrivenODE(BaseModel):
     def set_rhs(self, variables):
         if self.x_average is True:
             for domain in self.options.whole_cell_domains:
+                if domain == "separator":
+                    continue
                 eps_av = variables[f"X-averaged {domain} porosity"]
                 deps_dt_av = variables[f"X-averaged {domain} porosity change [s-1]"]
                 self.rhs.update({eps_av: deps_dt_av})
@@ -87,6 +97,8 @@ class ReactionDrivenODE(BaseModel):
     def set_initial_conditions(self, variables):
         if self.x_average is True:
             for domain in self.options.whole_cell_domains:
+                if domain == "separator":
+                    continue
                 eps_k_av = variables[f"X-averaged {domain} porosity"]
                 domain_param = self.param.domain_params[domain.split()[0]]
                 self.initial_conditions[eps_k_av] = domain_param.epsilon_init
@@ -5,6 +5,11 @@ import pybamm
 
 from .base_thermal import BaseThermal
 
+# Domains in which the temperature is the broadcast of the x-averaged temperature.
+# These are needed even for half-cell models, which use the negative electrode
+# temperature for planar electrode heating
+_ELECTRODE_DOMAINS = ("negative electrode", "separator", "positive electrode")
+
 
 class Lumped(BaseThermal):
     """
@@ -37,7 +42,7 @@ class Lumped(BaseThermal):
             "x-averaged cell": T_x_av,
             "volume-averaged cell": T_vol_av,
         }
-        for domain in ["negative electrode", "separator", "positive electrode"]:
+        for domain in _ELECTRODE_DOMAINS:
             T_dict[domain] = pybamm.PrimaryBroadcast(T_x_av, domain)
 
         variables = self._get_standard_fundamental_variables(T_dict)
@@ -53,16 +58,15 @@ class Lumped(BaseThermal):
         Q_vol_av = variables["Volume-averaged total heating [W.m-3]"]
         T_amb = variables["Volume-averaged ambient temperature [K]"]
 
-        # Newton cooling, accounting for surface area to volume ratio
+        # Newton cooling, accounting for surface area to volume ratio. The parameters
+        # are grouped so that they simplify to a single constant
         cell_surface_area = self.param.A_cooling
         cell_volume = self.param.V_cell
-        Q_cool_vol_av = (
-            -self.param.h_total * (T_vol_av - T_amb) * cell_surface_area / cell_volume
-        )
+        cooling_coefficient = -self.param.h_total * cell_surface_area / cell_volume
+        Q_cool_vol_av = cooling_coefficient * (T_vol_av - T_amb)
 
-        self.rhs = {
-            T_vol_av: (Q_vol_av + Q_cool_vol_av) / self.param.rho_c_p_eff(T_vol_av)
-        }
+        rho_c_p_eff_av = self.param.rho_c_p_eff(T_vol_av)
+        self.rhs = {T_vol_av: (Q_vol_av + Q_cool_vol_av) / rho_c_p_eff_av}
 
     def set_initial_conditions(self, variables):
         T_vol_av = variables["Volume-averaged cell temperature [K]"]
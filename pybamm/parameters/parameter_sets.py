@@ -70,6 +70,11 @@ class ParameterSets(Mapping):
             pass
         return ps
 
+    def __contains__(self, key) -> bool:
+        # Check the registered names directly, rather than the default Mapping
+        # behaviour of loading the parameter set and building its dictionary
+        return key in self.__all_parameter_sets
+
     def __iter__(self):
         return self.__all_parameter_sets.__iter__()
 
@@ -1,11 +1,27 @@
 #
 # Parameter values for a simulation
 #
+import functools
 import numpy as np
 import pybamm
 import numbers
 from pprint import pformat
 from collections import defaultdict
+from . import constants
+
+# Physical constants added to every set of parameter values. These are built once at
+# import time and copied into each new instance.
+_DEFAULT_CONSTANTS = {
+    "Ideal gas constant [J.K-1.mol-1]": constants.R.value,
+    "Faraday constant [C.mol-1]": constants.F.value,
+    "Boltzmann constant [J.K-1]": constants.k_b.value,
+    "Electron charge [C]": constants.q_e.value,
+}
+
+# Leaves of the expression tree that contain no parameters, so processing them returns
+# the symbol unchanged. Variables are not included since their scale, reference and
+# bounds may contain parameters
+_LEAF_PASSTHROUGH = (pybamm.Scalar, pybamm.Array, pybamm.StateVectorBase)
 
 
 class ParameterValues:
@@ -34,6 +50,8 @@ class ParameterValues:
 
     """
 
+    __slots__ = ("_dict_items", "_processed_symbols", "__weakref__")
+
     def __init__(self, values, chemistry=None):
         if chemistry is not None:
             raise ValueError(
@@ -44,14 +62,7 @@ class ParameterValues:
             )
 
         # add physical constants as default values
-        self._dict_items = pybamm.FuzzyDict(
-            {
-                "Ideal gas constant [J.K-1.mol-1]": pybamm.constants.R.value,
-                "Faraday constant [C.mol-1]": pybamm.constants.F.value,
-                "Boltzmann constant [J.K-1]": pybamm.constants.k_b.value,
-                "Electron charge [C]": pybamm.constants.q_e.value,
-            }
-        )
+        self._dict_items = pybamm.FuzzyDict(_DEFAULT_CONSTANTS)
 
         if isinstance(values, (dict, ParameterValues)):
             # remove the "chemistry" key if it exists
@@ -134,7 +145,25 @@ class ParameterValues:
 
         return pybamm.ParameterValues(pybamm_dict)
 
+    def __getstate__(self):
+        return {
+            "_dict_items": self._dict_items,
+            "_processed_symbols": self._processed_symbols,
+        }
+
+    def __setstate__(self, state):
+        # Objects pickled before __slots__ was added also store their state as a dict
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __getitem__(self, key):
+        # Look the key up with the plain dict method first, so that the common case
+        # of an existing key doesn't go through FuzzyDict.__getitem__, which is only
+        # needed to handle renamed or missing parameters
+        try:
+            return dict.__getitem__(self._dict_items, key)
+        except KeyError:
+            pass
         try:
             return self._dict_items[key]
         except KeyError as err:
@@ -600,6 +629,9 @@ class ParameterValues:
             Symbol with Parameter instances replaced by Value
 
         """
+        if isinstance(symbol, _LEAF_PASSTHROUGH):
+            return symbol
+
         try:
             return self._processed_symbols[symbol]
         except KeyError:
@@ -610,172 +642,7 @@ class ParameterValues:
 
     def _process_symbol(self, symbol):
         """See :meth:`ParameterValues.process_symbol()`."""
-
-        if isinstance(symbol, pybamm.Parameter):
-            value = self[symbol.name]
-            if isinstance(value, numbers.Number):
-                # Check not NaN (parameter in csv file but no value given)
-                if np.isnan(value):
-                    raise ValueError(f"Parameter '{symbol.name}' not found")
-                # Scalar inherits name
-                return pybamm.Scalar(value, name=symbol.name)
-            elif isinstance(value, pybamm.Symbol):
-                new_value = self.process_symbol(value)
-                new_value.copy_domains(symbol)
-                return new_value
-            else:
-                raise TypeError(f"Cannot process parameter '{value}'")
-
-        elif isinstance(symbol, pybamm.FunctionParameter):
-            function_name = self[symbol.name]
-            if isinstance(
-                function_name,
-                (numbers.Number, pybamm.Interpolant, pybamm.InputParameter),
-            ) or (
-                isinstance(function_name, pybamm.Symbol)
-                and function_name.size_for_testing == 1
-            ):
-                # no need to process children, they will only be used for shape
-                new_children = symbol.children
-            else:
-                # process children
-                new_children = []
-                for child in symbol.children:
-                    if symbol.diff_variable is not None and any(
-                        x == symbol.diff_variable for x in child.pre_order()
-                    ):
-                        # Wrap with NotConstant to avoid simplification,
-                        # which would stop symbolic diff from working properly
-                        new_child = pybamm.NotConstant(child)
-                        new_children.append(self.process_symbol(new_child))
-                    else:
-                        new_children.append(self.process_symbol(child))
-
-            # Create Function or Interpolant or Scalar object
-            if isinstance(function_name, tuple):
-                if len(function_name) == 2:  # CSV or JSON parsed data
-                    # to create an Interpolant
-                    name, data = function_name
-
-                    if len(data[0]) == 1:
-                        input_data = data[0][0], data[1]
-
-                    else:
-                        input_data = data
-
-                    # For parameters provided as data we use a cubic interpolant
-                    # Note: the cubic interpolant can be differentiated
-                    function = pybamm.Interpolant(
-                        input_data[0],
-                        input_data[-1],
-                        new_children,
-                        name=name,
-                    )
-
-                else:  # pragma: no cover
-                    raise ValueError(
-                        f"Invalid function name length: {len(function_name)}"
-                    )
-
-            elif isinstance(function_name, numbers.Number):
-                # Check not NaN (parameter in csv file but no value given)
-                if np.isnan(function_name):
-                    raise ValueError(
-                        f"Parameter '{symbol.name}' (possibly a function) not found"
-                    )
-                # If the "function" is provided is actually a scalar, return a Scalar
-                # object instead of throwing an error.
-                function = pybamm.Scalar(function_name, name=symbol.name)
-            elif callable(function_name):
-                # otherwise evaluate the function to create a new PyBaMM object
-                function = function_name(*new_children)
-            elif isinstance(
-                function_name, (pybamm.Interpolant, pybamm.InputParameter)
-            ) or (
-                isinstance(function_name, pybamm.Symbol)
-                and function_name.size_for_testing == 1
-            ):
-                function = function_name
-            else:
-                raise TypeError(
-                    f"Parameter provided for '{symbol.name}' "
-                    + "is of the wrong type (should either be scalar-like or callable)"
-                )
-            # Differentiate if necessary
-            if symbol.diff_variable is None:
-                # Use ones_like so that we get the right shapes
-                function_out = function * pybamm.ones_like(*new_children)
-            else:
-                # return differentiated function
-                new_diff_variable = self.process_symbol(symbol.diff_variable)
-                function_out = function.diff(new_diff_variable)
-            # Process again just to be sure
-            return self.process_symbol(function_out)
-
-        elif isinstance(symbol, pybamm.BinaryOperator):
-            # process children
-            new_left = self.process_symbol(symbol.left)
-            new_right = self.process_symbol(symbol.right)
-            # make new symbol, ensure domain remains the same
-            new_symbol = symbol._binary_new_copy(new_left, new_right)
-            new_symbol.copy_domains(symbol)
-            return new_symbol
-
-        # Unary operators
-        elif isinstance(symbol, pybamm.UnaryOperator):
-            new_child = self.process_symbol(symbol.child)
-            new_symbol = symbol._unary_new_copy(new_child)
-            # ensure domain remains the same
-            new_symbol.copy_domains(symbol)
-            # x_average can sometimes create a new symbol with electrode thickness
-            # parameters, so we process again to make sure these parameters are set
-            if isinstance(symbol, pybamm.XAverage) and not isinstance(
-                new_symbol, pybamm.XAverage
-            ):
-                new_symbol = self.process_symbol(new_symbol)
-            # f_a_dist in the size average needs to be processed
-            if isinstance(new_symbol, pybamm.SizeAverage):
-                new_symbol.f_a_dist = self.process_symbol(new_symbol.f_a_dist)
-            # position in evaluate at needs to be processed, and should be a Scalar
-            if isinstance(new_symbol, pybamm.EvaluateAt):
-                new_symbol_position = self.process_symbol(new_symbol.position)
-                if not isinstance(new_symbol_position, pybamm.Scalar):
-                    raise ValueError(
-                        "'position' in 'EvaluateAt' must evaluate to a scalar"
-                    )
-                else:
-                    new_symbol.position = new_symbol_position
-            return new_symbol
-
-        # Functions
-        elif isinstance(symbol, pybamm.Function):
-            new_children = [self.process_symbol(child) for child in symbol.children]
-            return symbol._function_new_copy(new_children)
-
-        # Concatenations
-        elif isinstance(symbol, pybamm.Concatenation):
-            new_children = [self.process_symbol(child) for child in symbol.children]
-            return symbol._concatenation_new_copy(new_children)
-
-        # Variables: update scale
-        elif isinstance(symbol, pybamm.Variable):
-            new_symbol = symbol.create_copy()
-            new_symbol._scale = self.process_symbol(symbol.scale)
-            reference = self.process_symbol(symbol.reference)
-            if isinstance(reference, pybamm.Vector):
-                # address numpy 1.25 deprecation warning: array should have ndim=0
-                # before conversion
-                reference = pybamm.Scalar((reference.evaluate()).item())
-            new_symbol._reference = reference
-            new_symbol.bounds = tuple([self.process_symbol(b) for b in symbol.bounds])
-            return new_symbol
-
-        elif isinstance(symbol, numbers.Number):
-            return pybamm.Scalar(symbol)
-
-        else:
-            # Backup option: return the object
-            return symbol
+        return _process_symbol_by_type(symbol, self)
 
     def evaluate(self, symbol, inputs=None):
         """
@@ -928,3 +795,180 @@ class ParameterValues:
                     file.write((s + " : {:10.4g}\n").format(name, value))
                 else:
                     file.write((s + " : {:10.3E}\n").format(name, value))
+
+
+# Processing of each type of symbol by :meth:`ParameterValues.process_symbol`.
+# Dispatching on the symbol class replaces a long chain of ``isinstance`` checks with
+# a single (cached) lookup, which matters since every node of every expression tree in
+# a model passes through here.
+@functools.singledispatch
+def _process_symbol_by_type(symbol, parameter_values):
+    # Backup option: return the object
+    return symbol
+
+
+@_process_symbol_by_type.register(numbers.Number)
+def _(symbol, parameter_values):
+    return pybamm.Scalar(symbol)
+
+
+@_process_symbol_by_type.register(pybamm.Parameter)
+def _(symbol, parameter_values):
+    value = parameter_values[symbol.name]
+    if isinstance(value, numbers.Number):
+        # Check not NaN (parameter in csv file but no value given)
+        if np.isnan(value):
+            raise ValueError(f"Parameter '{symbol.name}' not found")
+        # Scalar inherits name
+        return pybamm.Scalar(value, name=symbol.name)
+    elif isinstance(value, pybamm.Symbol):
+        new_value = parameter_values.process_symbol(value)
+        new_value.copy_domains(symbol)
+        return new_value
+    else:
+        raise TypeError(f"Cannot process parameter '{value}'")
+
+
+@_process_symbol_by_type.register(pybamm.FunctionParameter)
+def _(symbol, parameter_values):
+    function_name = parameter_values[symbol.name]
+    if isinstance(
+        function_name,
+        (numbers.Number, pybamm.Interpolant, pybamm.InputParameter),
+    ) or (
+        isinstance(function_name, pybamm.Symbol) and function_name.size_for_testing == 1
+    ):
+        # no need to process children, they will only be used for shape
+        new_children = symbol.children
+    else:
+        # process children
+        new_children = []
+        for child in symbol.children:
+            if symbol.diff_variable is not None and any(
+                x == symbol.diff_variable for x in child.pre_order()
+            ):
+                # Wrap with NotConstant to avoid simplification,
+                # which would stop symbolic diff from working properly
+                new_child = pybamm.NotConstant(child)
+                new_children.append(parameter_values.process_symbol(new_child))
+            else:
+                new_children.append(parameter_values.process_symbol(child))
+
+    # Create Function or Interpolant or Scalar object
+    if isinstance(function_name, tuple):
+        if len(function_name) == 2:  # CSV or JSON parsed data
+            # to create an Interpolant
+            name, data = function_name
+
+            if len(data[0]) == 1:
+                input_data = data[0][0], data[1]
+
+            else:
+                input_data = data
+
+            # For parameters provided as data we use the default (linear)
+            # interpolant
+            function = pybamm.Interpolant(
+                input_data[0],
+                input_data[-1],
+                new_children,
+                name=name,
+            )
+
+        else:  # pragma: no cover
+            raise ValueError(f"Invalid function name length: {len(function_name)}")
+
+    elif isinstance(function_name, numbers.Number):
+        # Check not NaN (parameter in csv file but no value given)
+        if np.isnan(function_name):
+            raise ValueError(
+                f"Parameter '{symbol.name}' (possibly a function) not found"
+            )
+        # If the "function" is provided is actually a scalar, return a Scalar
+        # object instead of throwing an error.
+        function = pybamm.Scalar(function_name, name=symbol.name)
+    elif callable(function_name):
+        # otherwise evaluate the function to create a new PyBaMM object
+        function = function_name(*new_children)
+    elif isinstance(function_name, (pybamm.Interpolant, pybamm.InputParameter)) or (
+        isinstance(function_name, pybamm.Symbol) and function_name.size_for_testing == 1
+    ):
+        function = function_name
+    else:
+        raise TypeError(
+            f"Parameter provided for '{symbol.name}' "
+            + "is of the wrong type (should either be scalar-like or callable)"
+        )
+    # Differentiate if necessary
+    if symbol.diff_variable is None:
+        # Use ones_like so that we get the right shapes
+        function_out = function * pybamm.ones_like(*new_children)
+    else:
+        # return differentiated function
+        new_diff_variable = parameter_values.process_symbol(symbol.diff_variable)
+        function_out = function.diff(new_diff_variable)
+    # Process again just to be sure
+    return parameter_values.process_symbol(function_out)
+
+
+@_process_symbol_by_type.register(pybamm.BinaryOperator)
+def _(symbol, parameter_values):
+    # process children
+    new_left = parameter_values.process_symbol(symbol.left)
+    new_right = parameter_values.process_symbol(symbol.right)
+    # make new symbol, ensure domain remains the same
+    new_symbol = symbol._binary_new_copy(new_left, new_right)
+    new_symbol.copy_domains(symbol)
+    return new_symbol
+
+
+@_process_symbol_by_type.register(pybamm.UnaryOperator)
+def _(symbol, parameter_values):
+    new_child = parameter_values.process_symbol(symbol.child)
+    new_symbol = symbol._unary_new_copy(new_child)
+    # ensure domain remains the same
+    new_symbol.copy_domains(symbol)
+    # x_average can sometimes create a new symbol with electrode thickness
+    # parameters, so we process again to make sure these parameters are set
+    if isinstance(symbol, pybamm.XAverage) and not isinstance(
+        new_symbol, pybamm.XAverage
+    ):
+        new_symbol = parameter_values.process_symbol(new_symbol)
+    # f_a_dist in the size average needs to be processed
+    if isinstance(new_symbol, pybamm.SizeAverage):
+        new_symbol.f_a_dist = parameter_values.process_symbol(new_symbol.f_a_dist)
+    # position in evaluate at needs to be processed, and should be a Scalar
+    if isinstance(new_symbol, pybamm.EvaluateAt):
+        new_symbol_position = parameter_values.process_symbol(new_symbol.position)
+        if not isinstance(new_symbol_position, pybamm.Scalar):
+            raise ValueError("'position' in 'EvaluateAt' must evaluate to a scalar")
+        else:
+            new_symbol.position = new_symbol_position
+    return new_symbol
+
+
+@_process_symbol_by_type.register(pybamm.Function)
+def _(symbol, parameter_values):
+    new_children = [parameter_values.process_symbol(child) for child in symbol.children]
+    return symbol._function_new_copy(new_children)
+
+
+@_process_symbol_by_type.register(pybamm.Concatenation)
+def _(symbol, parameter_values):
+    new_children = [parameter_values.process_symbol(child) for child in symbol.children]
+    return symbol._concatenation_new_copy(new_children)
+
+
+@_process_symbol_by_type.register(pybamm.Variable)
+def _(symbol, parameter_values):
+    # Variables: update scale
+    new_symbol = symbol.create_copy()
+    new_symbol._scale = parameter_values.process_symbol(symbol.scale)
+    reference = parameter_values.process_symbol(symbol.reference)
+    if isinstance(reference, pybamm.Vector):
+        # address numpy 1.25 deprecation warning: array should have ndim=0
+        # before conversion
+        reference = pybamm.Scalar((reference.evaluate()).item())
+    new_symbol._reference = reference
+    new_symbol.bounds = tuple(parameter_values.process_symbol(b) for b in symbol.bounds)
+    return new_symbol
@@ -1,5 +1,6 @@
 import os
 import json
+import functools
 import numpy as np
 
 
@@ -29,13 +30,45 @@ def _process_name(name, path, ext):
     return (filename, name.split(".")[0])
 
 
+def _file_key(filename):
+    # Key used to cache the contents of a file, so that the file is read again if it
+    # has been modified since it was last read
+    stat = os.stat(filename)
+    return (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_csv(file_key):
+    data = np.genfromtxt(file_key[0], delimiter=",", skip_header=1)
+    # the cached array is shared, so make sure it is never modified in place
+    data.flags.writeable = False
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _read_json(file_key):
+    with open(file_key[0]) as jsonfile:
+        json_data = json.load(jsonfile)
+    data = json_data["data"]
+    xs = tuple(np.array(el) for el in data[0])
+    y = np.array(data[1])
+    for array in (*xs, y):
+        array.flags.writeable = False
+    return xs, y
+
+
+def _load_csv(filename):
+    """Read a numeric csv file with a single header row into an array."""
+    return _read_csv(_file_key(filename)).copy()
+
+
 def process_1D_data(name, path=None):
     """
     Process 1D data from a csv file
     """
     filename, name = _process_name(name, path, ".csv")
 
-    data = np.genfromtxt(filename, delimiter=",", skip_header=1)
+    data = _load_csv(filename)
     x = data[:, 0]
     y = data[:, 1]
 
@@ -49,12 +82,9 @@ def process_2D_data(name, path=None):
     """
     filename, name = _process_name(name, path, ".json")
 
-    with open(filename) as jsonfile:
-        json_data = json.load(jsonfile)
-    data = json_data["data"]
-    data[0] = [np.array(el) for el in data[0]]
-    data[1] = np.array(data[1])
-    return (name, tuple(data))
+    xs, y = _read_json(_file_key(filename))
+    data = ([x.copy() for x in xs], y.copy())
+    return (name, data)
 
 
 def process_2D_data_csv(name, path=None):
@@ -88,7 +118,7 @@ def process_2D_data_csv(name, path=None):
 
     filename, name = _process_name(name, path, ".csv")
 
-    data = np.genfromtxt(filename, delimiter=",", skip_header=1)
+    data = _load_csv(filename)
 
     x1 = np.unique(data[:, 0])
     x2 = np.unique(data[:, 1])
@@ -135,7 +165,7 @@ def process_3D_data_csv(name, path=None):
 
     filename, name = _process_name(name, path, ".csv")
 
-    data = np.genfromtxt(filename, delimiter=",", skip_header=1)
+    data = _load_csv(filename)
 
     x1 = np.unique(data[:, 0])
     x2 = np.unique(data[:, 1])
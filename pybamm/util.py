@@ -4,18 +4,15 @@
 # The code in this file is adapted from Pints
 # (see https://github.com/pints-team/pints)
 #
-import argparse
+import bisect
+import functools
 import importlib.util
 import importlib.metadata
-import numbers
 import os
 import pathlib
-import pickle
-import subprocess
 import sys
 import timeit
 from platform import system
-import difflib
 from warnings import warn
 
 import pybamm
@@ -31,27 +28,61 @@ def root_dir():
     return str(pathlib.Path(pybamm.__path__[0]).parent)
 
 
+@functools.lru_cache(maxsize=1)
 def get_git_commit_info():
     """
     Get the git commit info for the current PyBaMM version, e.g. v22.8-39-gb25ce8c41
-    (version 22.8, commit b25ce8c41)
+    (version 22.8, commit b25ce8c41). The result is cached for the lifetime of the
+    process.
     """
+    import subprocess
+
+    version = f"v{pybamm.__version__}"
+    # Not a git repository (e.g. installed from a wheel) so just return the version
+    # number, without starting a subprocess
+    if not os.path.exists(os.path.join(root_dir(), ".git")):  # pragma: no cover
+        return version
     try:
         # Get the latest git commit hash
-        return str(
-            subprocess.check_output(["git", "describe", "--tags"], cwd=root_dir())
-            .strip()
-            .decode()
+        proc = subprocess.run(
+            ["git", "describe", "--tags"],
+            capture_output=True,
+            text=True,
+            check=False,
+            cwd=root_dir(),
         )
-    except subprocess.CalledProcessError:  # pragma: no cover
-        # Not a git repository so just return the version number
-        return f"v{pybamm.__version__}"
+    except OSError:  # pragma: no cover
+        # git is not installed
+        return version
+    if proc.returncode != 0:  # pragma: no cover
+        return version
+    return proc.stdout.strip()
+
+
+# rapidfuzz is an optional, faster replacement for difflib when suggesting the
+# closest keys of a FuzzyDict
+have_rapidfuzz = importlib.util.find_spec("rapidfuzz") is not None
 
 
 class FuzzyDict(dict):
     def get_best_matches(self, key):
         """Get best matches from keys"""
-        return difflib.get_close_matches(key, list(self.keys()), n=3, cutoff=0.5)
+        keys = list(self.keys())
+        if have_rapidfuzz:
+            rapidfuzz = import_optional_dependency("rapidfuzz")
+            return [
+                match
+                for match, _, _ in rapidfuzz.process.extract(
+                    key,
+                    keys,
+                    scorer=rapidfuzz.fuzz.ratio,
+                    limit=3,
+                    score_cutoff=50,
+                )
+            ]
+        import difflib
+
+        return difflib.get_close_matches(key, keys, n=3, cutoff=0.5)
 
     def __getitem__(self, key):
         try:
@@ -137,7 +168,8 @@ class FuzzyDict(dict):
             print("\n".join(f"{k}" for k in results.keys()))
 
     def copy(self):
-        return FuzzyDict(super().copy())
+        # Copy the items directly into a new FuzzyDict, rather than via a plain dict
+        return FuzzyDict(self)
 
 
 class Timer:
@@ -151,6 +183,8 @@ class Timer:
 
     """
 
+    __slots__ = ("_start",)
+
     def __init__(self):
         self._start = timeit.default_timer()
 
@@ -168,7 +202,16 @@ class Timer:
         return TimerTime(timeit.default_timer() - self._start)
 
 
+# Upper bounds, scale factors and suffixes used to format times below one minute,
+# and the units used to format longer times
+_TIMER_SUB_MINUTE_THRESHOLDS = (1e-6, 1e-3, 1, 60)
+_TIMER_SUB_MINUTE_FORMATS = ((1e9, "ns"), (1e6, "us"), (1e3, "ms"), (1, "s"))
+_TIMER_UNITS = ((604800, "week"), (86400, "day"), (3600, "hour"), (60, "minute"))
+
+
 class TimerTime:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         """A string whose value prints in human-readable form"""
         self.value = value
@@ -179,18 +222,13 @@ class TimerTime:
         "5 weeks, 3 days, 1 hour, 4 minutes, 9 seconds", or "0.0019 seconds".
         """
         time = self.value
-        if time < 1e-6:
-            return f"{time * 1e9:.3f} ns"
-        if time < 1e-3:
-            return f"{time * 1e6:.3f} us"
-        if time < 1:
-            return f"{time * 1e3:.3f} ms"
-        elif time < 60:
-            return f"{time:.3f} s"
+        i = bisect.bisect_right(_TIMER_SUB_MINUTE_THRESHOLDS, time)
+        if i < len(_TIMER_SUB_MINUTE_FORMATS):
+            scale, suffix = _TIMER_SUB_MINUTE_FORMATS[i]
+            return f"{time * scale:.3f} {suffix}"
         output = []
         time = int(round(time))
-        units = [(604800, "week"), (86400, "day"), (3600, "hour"), (60, "minute")]
-        for k, name in units:
+        for k, name in _TIMER_UNITS:
             f = time // k
             if f > 0 or output:
                 output.append(str(f) + " " + (name if f == 1 else name + "s"))
@@ -201,51 +239,53 @@ class TimerTime:
     def __repr__(self):
         return f"pybamm.TimerTime({self.value})"
 
+    def __getstate__(self):
+        return {"value": self.value}
+
+    def __setstate__(self, state):
+        # Objects pickled before __slots__ was added also store their state as a dict
+        self.value = state["value"]
+
+    # Arithmetic works with both numbers and other TimerTime objects, reading the
+    # value attribute when there is one
     def __add__(self, other):
-        if isinstance(other, numbers.Number):
-            return TimerTime(self.value + other)
-        else:
-            return TimerTime(self.value + other.value)
+        return TimerTime(self.value + getattr(other, "value", other))
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __sub__(self, other):
-        if isinstance(other, numbers.Number):
-            return TimerTime(self.value - other)
-        else:
-            return TimerTime(self.value - other.value)
+        return TimerTime(self.value - getattr(other, "value", other))
 
     def __rsub__(self, other):
-        if isinstance(other, numbers.Number):
-            return TimerTime(other - self.value)
+        return TimerTime(getattr(other, "value", other) - self.value)
 
     def __mul__(self, other):
-        if isinstance(other, numbers.Number):
-            return TimerTime(self.value * other)
-        else:
-            return TimerTime(self.value * other.value)
+        return TimerTime(self.value * getattr(other, "value", other))
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __truediv__(self, other):
-        if isinstance(other, numbers.Number):
-            return TimerTime(self.value / other)
-        else:
-            return TimerTime(self.value / other.value)
+        return TimerTime(self.value / getattr(other, "value", other))
 
     def __rtruediv__(self, other):
-        if isinstance(other, numbers.Number):
-            return TimerTime(other / self.value)
+        return TimerTime(getattr(other, "value", other) / self.value)
 
     def __eq__(self, other):
         return self.value == other.value
 
 
+# Read buffer size for loading pickled objects. Saved solutions can be hundreds of MB,
+# and a large buffer avoids the many small reads made by the unpickler
+LOAD_BUFFER_SIZE = 1 << 22
+
+
 def load(filename):
     """Load a saved object"""
-    with open(filename, "rb") as f:
+    import pickle
+
+    with open(filename, "rb", buffering=LOAD_BUFFER_SIZE) as f:
         obj = pickle.load(f)
     return obj
 
@@ -259,9 +299,12 @@ def get_parameters_filepath(path):
         return os.path.join(pybamm.__path__[0], path)
 
 
+@functools.lru_cache(maxsize=1)
 def have_jax():
     """
-    Check if jax and jaxlib are installed with the correct versions
+    Check if jax and jaxlib are installed with the correct versions. The result is
+    cached for the lifetime of the process, call ``have_jax.cache_clear()`` to check
+    again.
 
     Returns
     -------
@@ -270,15 +313,19 @@ def have_jax():
 
     """
     return (
-        (importlib.util.find_spec("jax") is not None)
-        and (importlib.util.find_spec("jaxlib") is not None)
+        all(
+            importlib.util.find_spec(module) is not None for module in ("jax", "jaxlib")
+        )
         and is_jax_compatible()
     )
 
 
+@functools.lru_cache(maxsize=1)
 def is_jax_compatible():
     """
-    Check if the available versions of jax and jaxlib are compatible with PyBaMM
+    Check if the available versions of jax and jaxlib are compatible with PyBaMM. The
+    result is cached for the lifetime of the process, call
+    ``is_jax_compatible.cache_clear()`` to check again.
 
     Returns
     -------
@@ -318,6 +365,9 @@ def install_jax(arguments=None):  # pragma: no cover
     |    -h, --help   show help message
     |    -f, --force  force install compatible versions of jax and jaxlib
     """
+    import argparse
+    import subprocess
+
     parser = argparse.ArgumentParser(description="Install jax and jaxlib")
     parser.add_argument(
         "-f",
@@ -5,6 +5,7 @@ from tests import TestCase
 
 import pybamm
 import unittest
+from unittest import mock
 
 
 class TestParameterSets(TestCase):
@@ -34,6 +35,15 @@ class TestParameterSets(TestCase):
         docstring = pybamm.parameter_sets.get_docstring("Marquis2019")
         self.assertRegex(docstring, "Parameters for a Kokam SLPB78205130H cell")
 
+    def test_contains(self):
+        """Test that membership checks do not load the parameter set"""
+        with mock.patch.object(
+            type(pybamm.parameter_sets), "__getitem__", side_effect=AssertionError
+        ):
+            self.assertIn("Marquis2019", pybamm.parameter_sets)
+            self.assertIn("Marquis2019", pybamm.parameter_sets.keys())
+            self.assertNotIn("not_a_real_parameter_set", pybamm.parameter_sets)
+
     def test_iter(self):
         """Test that iterating `pybamm.parameter_sets` iterates over keys"""
         for k in pybamm.parameter_sets:
@@ -4,10 +4,11 @@
 from tests import TestCase
 
 import os
+import pickle
 import unittest
 
 import numpy as np
-import pandas as pd
+import pytest
 
 import pybamm
 import tests.shared as shared
@@ -67,6 +68,19 @@ class TestParameterValues(TestCase):
             ],
         )
 
+    def test_pickle(self):
+        param = pybamm.ParameterValues({"a": 1})
+        new_param = pickle.loads(pickle.dumps(param))
+        self.assertEqual(new_param, param)
+        self.assertFalse(hasattr(new_param, "__dict__"))
+
+        # state stored as a dict, as in objects pickled before __slots__ was added
+        new_param = pybamm.ParameterValues.__new__(pybamm.ParameterValues)
+        new_param.__setstate__(
+            {"_dict_items": param._dict_items, "_processed_symbols": {}}
+        )
+        self.assertEqual(new_param["a"], 1)
+
     def test_eq(self):
         self.assertEqual(
             pybamm.ParameterValues({"a": 1}), pybamm.ParameterValues({"a": 1})
@@ -102,93 +116,6 @@ class TestParameterValues(TestCase):
         del param["a"]
         self.assertNotIn("a", param.keys())
 
-    def test_set_initial_stoichiometries(self):
-        param = pybamm.ParameterValues("Chen2020")
-        param.set_initial_stoichiometries(0.4)
-        param_0 = param.set_initial_stoichiometries(0, inplace=False)
-        param_100 = param.set_initial_stoichiometries(1, inplace=False)
-
-        # check that the stoichiometry of param is linearly interpolated between
-        # the min and max stoichiometries
-        x = param["Initial concentration in negative electrode [mol.m-3]"]
-        x_0 = param_0["Initial concentration in negative electrode [mol.m-3]"]
-        x_100 = param_100["Initial concentration in negative electrode [mol.m-3]"]
-        self.assertAlmostEqual(x, x_0 + 0.4 * (x_100 - x_0))
-
-        y = param["Initial concentration in positive electrode [mol.m-3]"]
-        y_0 = param_0["Initial concentration in positive electrode [mol.m-3]"]
-        y_100 = param_100["Initial concentration in positive electrode [mol.m-3]"]
-        self.assertAlmostEqual(y, y_0 - 0.4 * (y_0 - y_100))
-
-    def test_set_initial_stoichiometry_half_cell(self):
-        param = pybamm.lithium_ion.DFN(
-            {"working electrode": "positive"}
-        ).default_parameter_values
-        param = param.set_initial_stoichiometry_half_cell(
-            0.4, inplace=False, options={"working electrode": "positive"}
-        )
-        param_0 = param.set_initial_stoichiometry_half_cell(
-            0, inplace=False, options={"working electrode": "positive"}
-        )
-        param_100 = param.set_initial_stoichiometry_half_cell(
-            1, inplace=False, options={"working electrode": "positive"}
-        )
-
-        y = param["Initial concentration in positive electrode [mol.m-3]"]
-        y_0 = param_0["Initial concentration in positive electrode [mol.m-3]"]
-        y_100 = param_100["Initial concentration in positive electrode [mol.m-3]"]
-        self.assertAlmostEqual(y, y_0 - 0.4 * (y_0 - y_100))
-
-        # inplace for 100% coverage
-        param_t = pybamm.lithium_ion.DFN(
-            {"working electrode": "positive"}
-        ).default_parameter_values
-        param_t.set_initial_stoichiometry_half_cell(
-            0.4, inplace=True, options={"working electrode": "positive"}
-        )
-        y = param_t["Initial concentration in positive electrode [mol.m-3]"]
-        param_0 = pybamm.lithium_ion.DFN(
-            {"working electrode": "positive"}
-        ).default_parameter_values
-        param_0.set_initial_stoichiometry_half_cell(
-            0, inplace=True, options={"working electrode": "positive"}
-        )
-        y_0 = param_0["Initial concentration in positive electrode [mol.m-3]"]
-        param_100 = pybamm.lithium_ion.DFN(
-            {"working electrode": "positive"}
-        ).default_parameter_values
-        param_100.set_initial_stoichiometry_half_cell(
-            1, inplace=True, options={"working electrode": "positive"}
-        )
-        y_100 = param_100["Initial concentration in positive electrode [mol.m-3]"]
-        self.assertAlmostEqual(y, y_0 - 0.4 * (y_0 - y_100))
-
-        # test error
-        param = pybamm.ParameterValues("Chen2020")
-        with self.assertRaisesRegex(OptionError, "working electrode"):
-            param.set_initial_stoichiometry_half_cell(
-                0.1, options={"working electrode": "negative"}
-            )
-
-    def test_set_initial_ocps(self):
-        options = {
-            "open-circuit potential": "MSMR",
-            "particle": "MSMR",
-            "number of MSMR reactions": ("6", "4"),
-            "intercalation kinetics": "MSMR",
-        }
-        param_100 = pybamm.ParameterValues("MSMR_Example")
-        param_100.set_initial_ocps(1, inplace=True, options=options)
-        param_0 = param_100.set_initial_ocps(0, inplace=False, options=options)
-
-        Un_0 = param_0["Initial voltage in negative electrode [V]"]
-        Up_0 = param_0["Initial voltage in positive electrode [V]"]
-        self.assertAlmostEqual(Up_0 - Un_0, 2.8)
-
-        Un_100 = param_100["Initial voltage in negative electrode [V]"]
-        Up_100 = param_100["Initial voltage in positive electrode [V]"]
-        self.assertAlmostEqual(Up_100 - Un_100, 4.2)
-
     def test_check_parameter_values(self):
         with self.assertRaisesRegex(ValueError, "propotional term"):
             pybamm.ParameterValues(
@@ -288,7 +215,7 @@ class TestParameterValues(TestCase):
         # process concatenation
         conc = pybamm.concatenation(
             pybamm.Vector(np.ones(10), domain="test"),
-            pybamm.Vector(2 * np.ones(15), domain="test 2"),
+            pybamm.Vector(np.full(15, 2.0), domain="test 2"),
         )
         processed_conc = parameter_values.process_symbol(conc)
         self.assertIsInstance(processed_conc.children[0], pybamm.Vector)
@@ -318,23 +245,27 @@ class TestParameterValues(TestCase):
         # process scalar
         d = pybamm.Scalar(14)
         processed_d = parameter_values.process_symbol(d)
+        self.assertIs(processed_d, d)
         self.assertIsInstance(processed_d, pybamm.Scalar)
         self.assertEqual(processed_d.value, 14)
 
         # process array types
         e = pybamm.Vector(np.ones(4))
         processed_e = parameter_values.process_symbol(e)
+        self.assertIs(processed_e, e)
         self.assertIsInstance(processed_e, pybamm.Vector)
         np.testing.assert_array_equal(processed_e.evaluate(), np.ones((4, 1)))
 
         f = pybamm.Matrix(np.ones((5, 6)))
         processed_f = parameter_values.process_symbol(f)
+        self.assertIs(processed_f, f)
         self.assertIsInstance(processed_f, pybamm.Matrix)
         np.testing.assert_array_equal(processed_f.evaluate(), np.ones((5, 6)))
 
         # process statevector
         g = pybamm.StateVector(slice(0, 10))
         processed_g = parameter_values.process_symbol(g)
+        self.assertIs(processed_g, g)
         self.assertIsInstance(processed_g, pybamm.StateVector)
         np.testing.assert_array_equal(
             processed_g.evaluate(y=np.ones(10)), np.ones((10, 1))
@@ -525,8 +456,9 @@ class TestParameterValues(TestCase):
         self.assertEqual(processed_func.evaluate(), 3)
 
     def test_process_interpolant(self):
-        x = np.linspace(0, 10)[:, np.newaxis]
-        data = np.hstack([x, 2 * x])
+        data = np.empty((50, 2))
+        data[:, 0] = np.linspace(0, 10)
+        data[:, 1] = 2 * data[:, 0]
         parameter_values = pybamm.ParameterValues({"Times two": ("times two", data)})
 
         a = pybamm.InputParameter("a")
@@ -549,13 +481,7 @@ class TestParameterValues(TestCase):
     def test_process_interpolant_2d(self):
         x_ = [np.linspace(0, 10), np.linspace(0, 20)]
 
-        X = list(np.meshgrid(*x_, indexing="ij"))
-
-        x = np.column_stack([el.reshape(-1, 1) for el in X])
-
-        y = (2 * x).sum(axis=1)
-
-        Y = y.reshape(*[len(el) for el in x_])
+        Y = 2 * np.add.outer(*x_)
 
         data = x_, Y
 
@@ -583,9 +509,7 @@ class TestParameterValues(TestCase):
             processed_interp2.evaluate(inputs={"a": 3.01, "b": 4.4}), 14.82
         )
 
-        y3 = (3 * x).sum(axis=1)
-
-        Y3 = y3.reshape(*[len(el) for el in x_])
+        Y3 = 3 * np.add.outer(*x_)
 
         data3 = x_, Y3
 
@@ -691,7 +615,7 @@ class TestParameterValues(TestCase):
         filename, name = pybamm.parameters.process_parameter_data._process_name(
             name, path, ".csv"
         )
-        raw_df = pd.read_csv(filename)
+        raw_data = np.loadtxt(filename, delimiter=",", skiprows=1)
 
         # It's also helpful to check the casadi conversion here aswell
         # We check elsewhere but this helps catch additional bugs
@@ -699,23 +623,18 @@ class TestParameterValues(TestCase):
         interp_casadi = processed_interpolation.to_casadi(y=casadi_y)
         casadi_f = casadi.Function("f", [casadi_y], [interp_casadi])
 
-        # check that passing the input columns give the correct output
-        for values in raw_df.values:
-            y = np.array([values[0], values[1], values[2]])
-            f = values[3]
-            casadi_sol = casadi_f(y)
+        # check that passing the input columns give the correct output, evaluating
+        # all rows at once
+        y = raw_data[:, :3].T
+        f = raw_data[:, 3]
+        casadi_sol = casadi_f.map(y.shape[1])(y)
 
-            np.testing.assert_almost_equal(
-                processed_interpolation.evaluate(y=y)[0][0],
-                f,
-                decimal=10,
-            )
-
-            np.testing.assert_almost_equal(
-                f,
-                casadi_sol.__float__(),
-                decimal=10,
-            )
+        np.testing.assert_allclose(
+            processed_interpolation.evaluate(y=y).flatten(), f, rtol=0, atol=1e-10
+        )
+        np.testing.assert_allclose(
+            np.asarray(casadi_sol).flatten(), f, rtol=0, atol=1e-10
+        )
 
     def test_process_interpolant_2D_from_csv(self):
         name = "data_for_testing_2D"
@@ -738,147 +657,67 @@ class TestParameterValues(TestCase):
         filename, name = pybamm.parameters.process_parameter_data._process_name(
             name, path, ".csv"
         )
-        raw_df = pd.read_csv(filename)
-
-        # check that passing the input columns give the correct output
-        for values in raw_df.values:
-            y = np.array([values[0], values[1]])
-            f = values[2]
-
-            casadi_sol = casadi_f(y)
-
-            np.testing.assert_almost_equal(
-                processed_interpolation.evaluate(y=y)[0][0],
-                f,
-                decimal=10,
-            )
-
-            np.testing.assert_almost_equal(
-                f,
-                casadi_sol.__float__(),
-                decimal=10,
-            )
-
-    def test_process_integral_broadcast(self):
-        # Test that the x-average of a broadcast gets processed correctly
-        var = pybamm.Variable("var", domain="negative electrode")
-        func = pybamm.x_average(pybamm.FunctionParameter("func", {"var": var}))
-
-        param = pybamm.ParameterValues({"func": 2})
-        func_proc = param.process_symbol(func)
-
-        self.assertEqual(func_proc, pybamm.Scalar(2, name="func"))
+        raw_data = np.loadtxt(filename, delimiter=",", skiprows=1)
 
-        # test with auxiliary domains
+        # check that passing the input columns give the correct output, evaluating
+        # all rows at once
+        y = raw_data[:, :2].T
+        f = raw_data[:, 2]
+        casadi_sol = casadi_f.map(y.shape[1])(y)
 
-        # secondary
-        var = pybamm.Variable(
-            "var",
-            domain="negative electrode",
-            auxiliary_domains={"secondary": "current collector"},
+        np.testing.assert_allclose(
+            processed_interpolation.evaluate(y=y).flatten(), f, rtol=0, atol=1e-10
         )
-        func = pybamm.x_average(pybamm.FunctionParameter("func", {"var": var}))
-
-        param = pybamm.ParameterValues({"func": 2})
-        func_proc = param.process_symbol(func)
-
-        self.assertEqual(
-            func_proc,
-            pybamm.PrimaryBroadcast(pybamm.Scalar(2, name="func"), "current collector"),
-        )
-
-        # secondary and tertiary
-        var = pybamm.Variable(
-            "var",
-            domain="negative particle",
-            auxiliary_domains={
-                "secondary": "negative electrode",
-                "tertiary": "current collector",
-            },
+        np.testing.assert_allclose(
+            np.asarray(casadi_sol).flatten(), f, rtol=0, atol=1e-10
         )
-        func = pybamm.x_average(pybamm.FunctionParameter("func", {"var": var}))
 
+    def test_process_integral_broadcast(self):
+        # Test that the x-average of a broadcast gets processed correctly, with and
+        # without auxiliary domains
         param = pybamm.ParameterValues({"func": 2})
-        func_proc = param.process_symbol(func)
-
-        self.assertEqual(
-            func_proc,
-            pybamm.FullBroadcast(
-                pybamm.Scalar(2, name="func"), "negative particle", "current collector"
+        func_value = pybamm.Scalar(2, name="func")
+        cases = [
+            ("negative electrode", None, func_value),
+            (
+                "negative electrode",
+                {"secondary": "current collector"},
+                pybamm.PrimaryBroadcast(func_value, "current collector"),
             ),
-        )
-
-        # secondary, tertiary and quaternary
-        var = pybamm.Variable(
-            "var",
-            domain="negative particle",
-            auxiliary_domains={
-                "secondary": "negative particle size",
-                "tertiary": "negative electrode",
-                "quaternary": "current collector",
-            },
-        )
-        func = pybamm.x_average(pybamm.FunctionParameter("func", {"var": var}))
-
-        param = pybamm.ParameterValues({"func": 2})
-        func_proc = param.process_symbol(func)
-
-        self.assertEqual(
-            func_proc,
-            pybamm.FullBroadcast(
-                pybamm.Scalar(2, name="func"),
+            (
+                "negative particle",
+                {"secondary": "negative electrode", "tertiary": "current collector"},
+                pybamm.FullBroadcast(
+                    func_value, "negative particle", "current collector"
+                ),
+            ),
+            (
                 "negative particle",
                 {
                     "secondary": "negative particle size",
-                    "tertiary": "current collector",
+                    "tertiary": "negative electrode",
+                    "quaternary": "current collector",
                 },
+                pybamm.FullBroadcast(
+                    func_value,
+                    "negative particle",
+                    {
+                        "secondary": "negative particle size",
+                        "tertiary": "current collector",
+                    },
+                ),
             ),
-        )
-
-        # special case for integral of concatenations of broadcasts
-        var_n = pybamm.Variable("var_n", domain="negative electrode")
-        var_s = pybamm.Variable("var_s", domain="separator")
-        var_p = pybamm.Variable("var_p", domain="positive electrode")
-        func_n = pybamm.FunctionParameter("func_n", {"var_n": var_n})
-        func_s = pybamm.FunctionParameter("func_s", {"var_s": var_s})
-        func_p = pybamm.FunctionParameter("func_p", {"var_p": var_p})
-
-        func = pybamm.x_average(pybamm.concatenation(func_n, func_s, func_p))
-        param = pybamm.ParameterValues(
-            {
-                "func_n": 2,
-                "func_s": 3,
-                "func_p": 4,
-                "Negative electrode thickness [m]": 1,
-                "Separator thickness [m]": 1,
-                "Positive electrode thickness [m]": 1,
-            }
-        )
-        func_proc = param.process_symbol(func)
-
-        self.assertEqual(func_proc, pybamm.Scalar(3))
-
-        # with auxiliary domains
-        var_n = pybamm.Variable(
-            "var_n",
-            domain="negative electrode",
-            auxiliary_domains={"secondary": "current collector"},
-        )
-        var_s = pybamm.Variable(
-            "var_s",
-            domain="separator",
-            auxiliary_domains={"secondary": "current collector"},
-        )
-        var_p = pybamm.Variable(
-            "var_p",
-            domain="positive electrode",
-            auxiliary_domains={"secondary": "current collector"},
-        )
-        func_n = pybamm.FunctionParameter("func_n", {"var_n": var_n})
-        func_s = pybamm.FunctionParameter("func_s", {"var_s": var_s})
-        func_p = pybamm.FunctionParameter("func_p", {"var_p": var_p})
-
-        func = pybamm.x_average(pybamm.concatenation(func_n, func_s, func_p))
+        ]
+        for domain, auxiliary_domains, expected in cases:
+            with self.subTest(auxiliary_domains=auxiliary_domains):
+                var = pybamm.Variable(
+                    "var", domain=domain, auxiliary_domains=auxiliary_domains
+                )
+                func = pybamm.x_average(pybamm.FunctionParameter("func", {"var": var}))
+                self.assertEqual(param.process_symbol(func), expected)
+
+        # special case for integral of concatenations of broadcasts, with and without
+        # auxiliary domains
         param = pybamm.ParameterValues(
             {
                 "func_n": 2,
@@ -889,12 +728,31 @@ class TestParameterValues(TestCase):
                 "Positive electrode thickness [m]": 1,
             }
         )
-        func_proc = param.process_symbol(func)
-
-        self.assertEqual(
-            func_proc,
-            pybamm.PrimaryBroadcast(pybamm.Scalar(3), "current collector"),
-        )
+        cases = [
+            (None, pybamm.Scalar(3)),
+            (
+                {"secondary": "current collector"},
+                pybamm.PrimaryBroadcast(pybamm.Scalar(3), "current collector"),
+            ),
+        ]
+
+        def x_average_of_concatenation(auxiliary_domains):
+            funcs = []
+            for d, domain in [
+                ("n", "negative electrode"),
+                ("s", "separator"),
+                ("p", "positive electrode"),
+            ]:
+                var = pybamm.Variable(
+                    f"var_{d}", domain=domain, auxiliary_domains=auxiliary_domains
+                )
+                funcs.append(pybamm.FunctionParameter(f"func_{d}", {f"var_{d}": var}))
+            return pybamm.x_average(pybamm.concatenation(*funcs))
+
+        for auxiliary_domains, expected in cases:
+            with self.subTest(auxiliary_domains=auxiliary_domains):
+                func = x_average_of_concatenation(auxiliary_domains)
+                self.assertEqual(param.process_symbol(func), expected)
 
     def test_process_size_average(self):
         # Test that the x-average of a broadcast gets processed correctly
@@ -1051,6 +909,82 @@ class TestParameterValues(TestCase):
             parameter_values.evaluate(param)
 
 
+# Keep these tests on a single pytest-xdist worker (with --dist loadgroup), so the
+# parameter values in setUpClass are only built once
+@pytest.mark.xdist_group(name="parameter_values")
+class TestParameterValuesInitialConditions(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # loading a named parameter set or building a model to get its default
+        # parameter values is slow, so only do it once and give each test a copy
+        cls.chen2020 = pybamm.ParameterValues("Chen2020")
+        cls.half_cell = pybamm.lithium_ion.DFN(
+            {"working electrode": "positive"}
+        ).default_parameter_values
+
+    def test_set_initial_stoichiometries(self):
+        param = self.chen2020.copy()
+        param.set_initial_stoichiometries(0.4)
+        param_0 = param.set_initial_stoichiometries(0, inplace=False)
+        param_100 = param.set_initial_stoichiometries(1, inplace=False)
+
+        # check that the stoichiometry of param is linearly interpolated between
+        # the min and max stoichiometries
+        x = param["Initial concentration in negative electrode [mol.m-3]"]
+        x_0 = param_0["Initial concentration in negative electrode [mol.m-3]"]
+        x_100 = param_100["Initial concentration in negative electrode [mol.m-3]"]
+        self.assertAlmostEqual(x, x_0 + 0.4 * (x_100 - x_0))
+
+        y = param["Initial concentration in positive electrode [mol.m-3]"]
+        y_0 = param_0["Initial concentration in positive electrode [mol.m-3]"]
+        y_100 = param_100["Initial concentration in positive electrode [mol.m-3]"]
+        self.assertAlmostEqual(y, y_0 - 0.4 * (y_0 - y_100))
+
+    def _half_cell_concentration(self, stoichiometry, inplace):
+        param = self.half_cell.copy()
+        new_param = param.set_initial_stoichiometry_half_cell(
+            stoichiometry, inplace=inplace, options={"working electrode": "positive"}
+        )
+        if inplace:
+            new_param = param
+        return new_param["Initial concentration in positive electrode [mol.m-3]"]
+
+    def test_set_initial_stoichiometry_half_cell(self):
+        # check both the new copy and inplace (for 100% coverage) versions
+        for inplace in [False, True]:
+            y = self._half_cell_concentration(0.4, inplace)
+            y_0 = self._half_cell_concentration(0, inplace)
+            y_100 = self._half_cell_concentration(1, inplace)
+            self.assertAlmostEqual(y, y_0 - 0.4 * (y_0 - y_100))
+
+        # test error
+        param = self.chen2020.copy()
+        with self.assertRaisesRegex(OptionError, "working electrode"):
+            param.set_initial_stoichiometry_half_cell(
+                0.1, options={"working electrode": "negative"}
+            )
+
+    def test_set_initial_ocps(self):
+        options = {
+            "open-circuit potential": "MSMR",
+            "particle": "MSMR",
+            "number of MSMR reactions": ("6", "4"),
+            "intercalation kinetics": "MSMR",
+        }
+        param_100 = pybamm.ParameterValues("MSMR_Example")
+        param_100.set_initial_ocps(1, inplace=True, options=options)
+        param_0 = param_100.set_initial_ocps(0, inplace=False, options=options)
+
+        Un_0 = param_0["Initial voltage in negative electrode [V]"]
+        Up_0 = param_0["Initial voltage in positive electrode [V]"]
+        self.assertAlmostEqual(Up_0 - Un_0, 2.8)
+
+        Un_100 = param_100["Initial voltage in negative electrode [V]"]
+        Up_100 = param_100["Initial voltage in positive electrode [V]"]
+        self.assertAlmostEqual(Up_100 - Un_100, 4.2)
+
+
 if __name__ == "__main__":
     print("Add -v for more debug output")
     import sys
@@ -4,6 +4,7 @@
 from tests import TestCase
 
 import os
+import tempfile
 import numpy as np
 import pybamm
 
@@ -53,6 +54,25 @@ class TestProcessParameterData(TestCase):
         self.assertIsInstance(processed[1][0][2], np.ndarray)
         self.assertIsInstance(processed[1][1], np.ndarray)
 
+    def test_process_1D_data_cache(self):
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "data.csv")
+            with open(filename, "w") as f:
+                f.write("x,y\n0,1\n1,2\n")
+            _, (x, y) = pybamm.parameters.process_1D_data("data", path)
+            np.testing.assert_array_equal(y, [1, 2])
+
+            # modifying the returned data does not change the cached data
+            y[0] = 10
+            _, (x, y) = pybamm.parameters.process_1D_data("data", path)
+            np.testing.assert_array_equal(y, [1, 2])
+
+            # changing the file invalidates the cached data
+            with open(filename, "w") as f:
+                f.write("x,y\n0,3\n1,4\n2,5\n")
+            _, (x, y) = pybamm.parameters.process_1D_data("data", path)
+            np.testing.assert_array_equal(y, [3, 4, 5])
+
     def test_error(self):
         with self.assertRaisesRegex(FileNotFoundError, "Could not find file"):
             pybamm.parameters.process_1D_data("not_a_real_file", "not_a_real_path")
@@ -4,6 +4,7 @@
 # The code in this file is adapted from Pints
 # (see https://github.com/pints-team/pints)
 #
+import pickle
 import pybamm
 import unittest
 from tests import TestCase
@@ -72,6 +73,15 @@ class TestTimer(TestCase):
         self.assertTrue(pybamm.TimerTime(1) == pybamm.TimerTime(1))
         self.assertTrue(pybamm.TimerTime(1) != pybamm.TimerTime(2))
 
+    def test_timer_time_pickle(self):
+        t = pybamm.TimerTime(1.5)
+        self.assertEqual(pickle.loads(pickle.dumps(t)), t)
+
+        # objects pickled before TimerTime used __slots__ store a dict
+        t_old = pybamm.TimerTime.__new__(pybamm.TimerTime)
+        t_old.__setstate__({"value": 1.5})
+        self.assertEqual(t_old, t)
+
 
 if __name__ == "__main__":
     print("Add -v for more debug output")
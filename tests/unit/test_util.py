@@ -1,3 +1,4 @@
+import copy
 import importlib
 from tests import TestCase
 import os
@@ -43,6 +44,43 @@ class TestUtil(TestCase):
         with self.assertRaisesRegex(KeyError, "'test3' not found. Best matches are "):
             d.__getitem__("test3")
 
+        # best matches are updated when the dictionary is modified
+        d["test4"] = 7
+        with self.assertRaisesRegex(KeyError, "test4"):
+            d.__getitem__("test5")
+        del d["test4"]
+
+        # copies are independent of the original
+        d_copy = d.copy()
+        self.assertIsInstance(d_copy, pybamm.FuzzyDict)
+        self.assertEqual(d_copy, d)
+        d_copy["test4"] = 7
+        self.assertNotIn("test4", d)
+        with self.assertRaisesRegex(KeyError, "test4"):
+            d_copy.__getitem__("test5")
+
+        # copy.copy keeps the type and attributes of subclasses
+        options = pybamm.BatteryModelOptions({})
+        options_copy = copy.copy(options)
+        self.assertIsInstance(options_copy, pybamm.BatteryModelOptions)
+        self.assertEqual(options_copy.possible_options, options.possible_options)
+        self.assertEqual(options_copy, options)
+
+        # difflib is used when rapidfuzz is not available
+        with patch("pybamm.util.have_rapidfuzz", False):
+            self.assertEqual(d.get_best_matches("test3"), ["test", "test2"])
+
+        # rapidfuzz and difflib agree on the best match
+        if pybamm.util.have_rapidfuzz:
+            params = pybamm.ParameterValues("Chen2020")._dict_items
+            for key, expected in [
+                ("Ambient temp [K]", "Ambient temperature [K]"),
+                ("Negative electrode thicknes [m]", "Negative electrode thickness [m]"),
+            ]:
+                self.assertEqual(params.get_best_matches(key)[0], expected)
+                with patch("pybamm.util.have_rapidfuzz", False):
+                    self.assertEqual(params.get_best_matches(key)[0], expected)
+
         with self.assertRaisesRegex(KeyError, "stoichiometry"):
             d.__getitem__("Negative electrode SOC")
 
@@ -107,9 +145,13 @@ class TestUtil(TestCase):
             ):
                 pybamm.util.import_optional_dependency(import_pkg)
 
-        # Restore optional dependencies
+        # Restore optional dependencies, leaving those that were not imported yet
+        # importable
         for import_pkg in present_optional_import_deps:
-            sys.modules[import_pkg] = modules[import_pkg]
+            if modules[import_pkg] is None:
+                sys.modules.pop(import_pkg)
+            else:
+                sys.modules[import_pkg] = modules[import_pkg]
 
     def test_pybamm_import(self):
         optional_distribution_deps = get_optional_distribution_deps("pybamm")
@@ -125,11 +167,12 @@ class TestUtil(TestCase):
                 modules[module_name] = module
                 sys.modules[module_name] = None
 
-        # Unload pybamm and its sub-modules
+        # Unload pybamm and its sub-modules, keeping them to restore afterwards
+        pybamm_modules = {}
         for module_name in list(sys.modules.keys()):
             base_module_name = module_name.split(".")[0]
             if base_module_name == "pybamm":
-                sys.modules.pop(module_name)
+                pybamm_modules[module_name] = sys.modules.pop(module_name)
 
         # Test pybamm is still importable
         try:
@@ -142,6 +185,12 @@ class TestUtil(TestCase):
             # Restore optional dependencies and their sub-modules
             for module_name, module in modules.items():
                 sys.modules[module_name] = module
+            # Restore the original pybamm modules, so that later tests (e.g. ones
+            # that pickle pybamm objects) don't see the re-imported classes
+            for module_name in list(sys.modules.keys()):
+                if module_name.split(".")[0] == "pybamm":
+                    sys.modules.pop(module_name)
+            sys.modules.update(pybamm_modules)
 
     def test_optional_dependencies(self):
         optional_distribution_deps = get_optional_distribution_deps("pybamm")
@@ -190,6 +239,12 @@ class TestSearch(TestCase):
             param.search("test")
             self.assertEqual(fake_out.getvalue(), "test\t10\n")
 
+        # Test search after the dictionary has been modified
+        param.update({"Test3": 30}, check_already_exists=False)
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            param.search("test")
+            self.assertEqual(fake_out.getvalue(), "Test3\t30\ntest\t10\n")
+
 
 if __name__ == "__main__":
     print("Add -v for more debug output")